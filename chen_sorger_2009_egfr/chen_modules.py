@@ -32,7 +32,7 @@ KINTF = 1.3e-3
 KINTR = 5.0e-5
 KDEG = .1
 
-from parameter_dict_A431 import parameter_dict as par
+from .parameter_dict_A431 import parameter_dict as par
 #FIXME: What is Inh in reaction list?
         
 # Monomer declarations
@@ -54,10 +54,9 @@ def rec_monomers():
 
 def rec_initial():
     # # Initial concentrations (except DEP1) for all cell types taken from Chen et al 2009 -- see Jacobian files
-    Parameter('EGF_0',      3.01e12) # c1 5 nM EGF = 3.01e12 molec/cell; .01 nM EGF = 6.02e9 molec/cell 
-    Parameter('HRG_0',         0) # c514 5 nM HRG = 3.01e12 molec/cell; .01 nM EGF = 6.02e9 molec/cell
+    EGF_0 = Parameter('EGF_0',      3.01e12) # c1 5 nM EGF = 3.01e12 molec/cell; .01 nM EGF = 6.02e9 molec/cell 
+    HRG_0 = Parameter('HRG_0',         0) # c514 5 nM HRG = 3.01e12 molec/cell; .01 nM EGF = 6.02e9 molec/cell
     # Other initial values set in parameter dictionary file for given cell type.
-    alias_model_components()
 
     Initial(EGF(b=None, st='M'), EGF_0)
     Initial(HRG(b=None), HRG_0)
@@ -76,8 +75,6 @@ def rec_events():
     
     # Parameter definitions
     # =====================
-    # Alias model components for names in present namespace
-    alias_model_components()
     # EGF / HRG binding to receptors
     # EGF / HRG receptor binding rates obtained from Chen et al Jacobian files
     bind_table([[                                                          EGF(st='M'),                                   HRG],
@@ -118,7 +115,7 @@ def rec_events():
 
     for i in ['_1', '_2', '_4']:
         Rule('ATP_bind_ErbB'+i,
-             erbb(ty=i, st='U', loc='C', b=None, bd=1) % erbb(st='U', loc='C', b=None, bd=1) + ATP(b=None) |
+             erbb(ty=i, st='U', loc='C', b=None, bd=1) % erbb(st='U', loc='C', b=None, bd=1) + ATP_free |
              erbb(ty=i, st='U', loc='C', b=2, bd=1) % erbb(st='U', loc='C', b=None, bd=1) % ATP(b=2),
              *par['ErbB'+i+'_bind_ATP'])
     
@@ -324,8 +321,6 @@ def mapk_monomers():
 
 def mapk_initial():
     # Initial values declared in parameter dictionary for given cell type.
-    alias_model_components()
-
     Initial(GAP(bd=None, b=None, bgrb2=None), GAP_0)
     Initial(SHC(bgap=None, bgrb=None, batp=None, st='U'), SHC_0)
     Initial(GRB2(b=None, bsos=None, bgap=None, bgab1=None, bcpp=None), GRB2_0)
@@ -342,9 +337,10 @@ def mapk_initial():
     
 def mapk_events():
 
-    # =====================
-    # Alias model components for names in present namespace
-    alias_model_components()
+    # Rate constants shared by several rules below
+    p_gap_1, p_gap_2, p_gap_shcp = par['ErbB_bind_GAP_1'], par['ErbB_bind_GAP_2'], par['GAP_bind_SHCP']
+    p_rasgdp_bind, p_rasgtp_bind = par['RASGDP_bind_bound_GRB2_SOS'], par['RASGTP_bind_bound_GRB2_SOS']
+    p_rasgtpact_bind, p_rasgtp_unbind = par['RASGTPact_bind_bound_GRB2_SOS'], par['RASGTP_unbind_GRB2_SOS']
 
     # GAP binds to phosphorylated dimers
     # in the present we use MatchOnce to insure correct representation of the binding
@@ -354,30 +350,30 @@ def mapk_events():
     Rule("GAP_binding_1",
          MatchOnce(erbb(bd=1, b=None, st='P', ty='_1') % erbb(bd=1, b=None, st='P', ty='_1')) + GAP(bd=None, b=None, bgrb2=None) |
          MatchOnce(erbb(bd=1, b=2,    st='P', ty='_1') % erbb(bd=1, b=None, st='P', ty='_1') % GAP(bd=2, b=None, bgrb2=None)),
-         *par['ErbB_bind_GAP_1'])
+         *p_gap_1)
 
     for i in ['_2', '_3', '_4']:
         Rule('GAP_binding_2'+i,
              MatchOnce(erbb(bd=1, b=None, st='P', ty='_2') % erbb(bd=1, b=None, st='P', ty=i)) + GAP(bd=None, b=None, bgrb2=None) |
              MatchOnce(erbb(bd=1, b=2, st='P', ty='_2') % erbb(bd=1, b=None, st='P', ty=i) % GAP(bd=2, b=None, bgrb2=None)),
-             *par['ErbB_bind_GAP_1'])
+             *p_gap_1)
 
         Rule('GAP_binding_2_2'+i,
              MatchOnce(erbb(bd=1, b=None, st='P', ty=i) % erbb(bd=1, b=None, st='P', ty='_2')) + GAP(bd=None, b=None, bgrb2=None) |
              MatchOnce(erbb(bd=1, b=2, st='P', ty=i) % erbb(bd=1, b=None, st='P', ty='_2') % GAP(bd=2, b=None, bgrb2=None)),
-             *par['ErbB_bind_GAP_1'])
+             *p_gap_1)
 
     # Rate 2: ErbB1/ErbBX, X=2, 3, 4  Note: In Chen/Sorger rxn list, plasma membrane ErbB1/ErbB2 dimers are assigned Rate 1 (above); however the other 5 ErbB1/ErbBX combinations (plasma and endosomal membranes) are assigned Rate 2.  ErbB1/ErbB2 was assigned the latter in this model under the assumption that this was accidental.
     for i in ['_2', '_3', '_4']:
         Rule('GAP_binding_3'+i,
              MatchOnce(erbb(bd=1, b=None, st='P', ty='_1') % erbb(bd=1, b=None, st='P', ty=i)) + GAP(bd=None, b=None, bgrb2=None) |
              MatchOnce(erbb(bd=1, b=2, st='P', ty='_1') % erbb(bd=1, b=None, st='P', ty=i) % GAP(bd=2, b=None, bgrb2=None)),
-             *par['ErbB_bind_GAP_2'])
+             *p_gap_2)
 
         Rule('GAP_binding_3_2'+i,
              MatchOnce(erbb(bd=1, b=None, st='P', ty=i) % erbb(bd=1, b=None, st='P', ty='_1')) + GAP(bd=None, b=None, bgrb2=None) |
              MatchOnce(erbb(bd=1, b=2, st='P', ty=i) % erbb(bd=1, b=None, st='P', ty='_1') % GAP(bd=2, b=None, bgrb2=None)),
-             *par['ErbB_bind_GAP_2'])
+             *p_gap_2)
     
     # SHC binds to GAP-complex
     # Chen-Sorger model assigns 2 sets of rate constants to different dimer combinations.  The kf is the same variable; two different kr variables are used but are assigned the same values in the Jacobian files.  These have been combined into one set in this model.
@@ -385,13 +381,13 @@ def mapk_events():
     bind(GAP(bd=ANY, bgrb2=None), 'b', SHC(batp=None, st='U', bgrb=None), 'bgap', par['GAP_bind_SHC'])
 
     #SHC:P binds GAP
-    bind(GAP(bd=ANY, bgrb2=None), 'b', SHC(batp=None, st='P', bgrb=None), 'bgap', par['GAP_bind_SHCP'])
+    bind(GAP(bd=ANY, bgrb2=None), 'b', SHC(batp=None, st='P', bgrb=None), 'bgap', p_gap_shcp)
 
     #SHC:P-GRB2 binds GAP
     Rule('GAP_bind_SHCP_GRB2',
          GAP(bd=ANY, b=None, bgrb2=None) + SHC(batp=None, st='P', bgrb=1, bgap=None) % GRB2(bgap=None, bgab1=None, bsos=None, bcpp=None, b=1) |
          GAP(bd=ANY, b=2, bgrb2=None) % SHC(batp=None, st='P', bgrb=1, bgap=2) % GRB2(bgap=None, bgab1=None, bsos=None, bcpp=None, b=1),
-         *par['GAP_bind_SHCP'])
+         *p_gap_shcp)
 
     # Bound and unbound SHC phosphorylation - These are represented by two kf, kr pairs in the Chen-Sorger model:
     Rule('SHC_phos',
@@ -455,30 +451,30 @@ def mapk_events():
     # SOS also binds GAP-GRB2
     Rule("GAP_GRB2_bind_SOS",
          GRB2(bgap=ANY, bgab1=None, b=None, bsos=None, bcpp=None) + SOS(bras=None, bgrb=None, bERKPP=None, st='U') |
-         GRB2(bgap=ANY, bgab1=None, b=None, bsos=1, bcpp=None) % SOS(bras=None, bgrb=1, st='U', bERKPP=None),
+         GRB2_GAP % SOS(bras=None, bgrb=1, st='U', bERKPP=None),
          *par['SOS_bind_GAP_GRB2'])
 
     # GAP-GRB2-SOS and GAP-SHC:P-GRB2-SOS catalyze RAS-GDP->RAS-GTP:
     Rule("GAP_GRB2_SOS_bind_RASGDP",
-         GRB2(bgap=ANY, bgab1=None, b=None, bsos=1, bcpp=None) % SOS(bras=None, bgrb=1, bERKPP=None, st='U') + RAS(braf=None, bsos=None, st='GDP', act='N', bpi3k=None) |
-         GRB2(bgap=ANY, bgab1=None, b=None, bsos=1, bcpp=None) % SOS(bras=2, bgrb=1, bERKPP=None, st='U') % RAS(braf=None, bsos=2, st='GDP', act='N', bpi3k=None),
-         *par['RASGDP_bind_bound_GRB2_SOS'])
+         GRB2_GAP % SOS_U_free + RAS_GDP |
+         GRB2_GAP % SOS_U_bound % RAS_GDP_bound,
+         *p_rasgdp_bind)
 
     Rule("GAP_SHCP_GRB2_SOS_bind_RASGDP",
-         SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, b=ANY, bsos=1, bcpp=None) % SOS(bras=None, bgrb=1, bERKPP=None, st='U') + RAS(braf=None, bsos=None, st='GDP', act='N', bpi3k=None) |
-         SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, b=ANY, bsos=1, bcpp=None) % SOS(bras=2, bgrb=1, bERKPP=None, st='U') % RAS(braf=None, bsos=2, st='GDP', act='N', bpi3k=None),
-         *par['RASGDP_bind_bound_GRB2_SOS'])
+         SHCP_bound % GRB2_SHC % SOS_U_free + RAS_GDP |
+         SHCP_bound % GRB2_SHC % SOS_U_bound % RAS_GDP_bound,
+         *p_rasgdp_bind)
 
     # Instead of a one-way catalytic process, the Chen-Sorger model implements this as a bidirectional process, as below:
     Rule('GAP_GRB2_SOS_bind_RASGTP',
-         GRB2(bgap=ANY, bgab1=None, b=None, bsos=1, bcpp=None) % SOS(bras=None, bgrb=1, bERKPP=None, st='U') + RAS(braf=None, bsos=None, st='GTP', act='N', bpi3k=None) |
-         GRB2(bgap=ANY, bgab1=None, b=None, bsos=1, bcpp=None) % SOS(bras=2, bgrb=1, bERKPP=None, st='U') % RAS(braf=None, bsos=2, st='GDP', act='N', bpi3k=None),
-         *par['RASGTP_bind_bound_GRB2_SOS'])
+         GRB2_GAP % SOS_U_free + RAS_GTP |
+         GRB2_GAP % SOS_U_bound % RAS_GDP_bound,
+         *p_rasgtp_bind)
 
     Rule('GAP_SHCP_GRB2_SOS_bind_RASGTP',
-         SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, b=ANY, bsos=1, bcpp=None) % SOS(bras=None, bgrb=1, bERKPP=None, st='U') + RAS(braf=None, bsos=None, st='GTP', act='N', bpi3k=None) |
-         SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, b=ANY, bsos=1, bcpp=None) % SOS(bras=2, bgrb=1, bERKPP=None, st='U') % RAS(braf=None, bsos=2, st='GDP', act='N', bpi3k=None),
-         *par['RASGTP_bind_bound_GRB2_SOS'])
+         SHCP_bound % GRB2_SHC % SOS_U_free + RAS_GTP |
+         SHCP_bound % GRB2_SHC % SOS_U_bound % RAS_GDP_bound,
+         *p_rasgtp_bind)
 
     # If a catalytic process is desired instead, use these rules:
     # Rule("GAP_GRB2_SOS_catRAS",
@@ -498,71 +494,49 @@ def mapk_events():
 
     # Recycling of activated RAS-GTP --> RAS-GDP.  In Chen/Sorger model, activated RAS-GTP is produced upon Raf phosphorylation.
     Rule('RASGTPact_bind_SOS_SHCP_complex',
-         SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, b=ANY, bsos=1, bcpp=None) % SOS(bras=None, bgrb=1, bERKPP=None, st='U') + RAS(braf=None, bsos=None, st='GTP', act='Y', bpi3k=None) |
-         SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, b=ANY, bsos=1, bcpp=None) % SOS(bras=None, bgrb=1, bERKPP=None, st='U') % RAS(braf=None, bsos=None, st='GTP', act='N', bpi3k=None),
-         *par['RASGTPact_bind_bound_GRB2_SOS'])
+         SHCP_bound % GRB2_SHC % SOS_U_free + RAS_GTP_active |
+         SHCP_bound % GRB2_SHC % SOS_U_free % RAS_GTP,
+         *p_rasgtpact_bind)
 
     Rule('RASGTPact_bind_SOS_GRB2_GAP_complex',
-         GRB2(bgap=ANY, bgab1=None, b=None, bsos=1, bcpp=None) % SOS(bras=None, bgrb=1, bERKPP=None, st='U') + RAS(braf=None, bsos=None, st='GTP', act='Y', bpi3k=None) |
-         GRB2(bgap=ANY, bgab1=None, b=None, bsos=1, bcpp=None) % SOS(bras=None, bgrb=1, bERKPP=None, st='U') % RAS(braf=None, bsos=None, st='GTP', act='N', bpi3k=None),
-         *par['RASGTPact_bind_bound_GRB2_SOS'])
+         GRB2_GAP % SOS_U_free + RAS_GTP_active |
+         GRB2_GAP % SOS_U_free % RAS_GTP,
+         *p_rasgtpact_bind)
 
     Rule('RASGTP_unbind_SOS_GRB2_SHCP_complex',
-         SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, b=ANY, bsos=1, bcpp=None) % SOS(bras=2, bgrb=1, bERKPP=None, st='U') % RAS(braf=None, bsos=2, st='GTP', act='N', bpi3k=None) |
-         SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, b=ANY, bsos=1, bcpp=None) % SOS(bras=None, bgrb=1, bERKPP=None, st='U') + RAS(braf=None, bsos=None, st='GDP', act='N', bpi3k=None),
-         *par['RASGTP_unbind_GRB2_SOS'])
+         SHCP_bound % GRB2_SHC % SOS_U_bound % RAS_GTP_bound |
+         SHCP_bound % GRB2_SHC % SOS_U_free + RAS_GDP,
+         *p_rasgtp_unbind)
 
     Rule('RASGTP_unbind_SOS_GRB2_GAP_complex',
-         GRB2(bgap=ANY, bgab1=None, b=None, bsos=1, bcpp=None) % SOS(bras=2, bgrb=1, bERKPP=None, st='U') % RAS(braf=None, bsos=2, st='GTP', act='N', bpi3k=None) |
-         GRB2(bgap=ANY, bgab1=None, b=None, bsos=1, bcpp=None) % SOS(bras=None, bgrb=1, bERKPP=None, st='U') + RAS(braf=None, bsos=None, st='GDP', act='N', bpi3k=None),
-         *par['RASGTP_unbind_GRB2_SOS'])
+         GRB2_GAP % SOS_U_bound % RAS_GTP_bound |
+         GRB2_GAP % SOS_U_free + RAS_GDP,
+         *p_rasgtp_unbind)
 
     # Activation of RAF -> RAF:P by RAS-GTP
     Rule('RASGTP_bind_RAF',
-         RAS(bsos=None, bpi3k=None, st='GTP', act='N', braf=None) + RAF(st='U', ser295='U', b=None) |
+         RAS_GTP + RAF(st='U', ser295='U', b=None) |
          RAS(bsos=None, bpi3k=None, st='GTP', act='N', braf=1) % RAF(st='U', ser295='U', b=1),
          *par['RASGTP_bind_RAF'])
 
     Rule('RASGTP_RAF_cat',
-         RAS(bsos=None, bpi3k=None, st='GTP', act='Y', braf=None) + RAF(st='P', ser295='U', b=None) |
+         RAS_GTP_active + RAF(st='P', ser295='U', b=None) |
          RAS(bsos=None, bpi3k=None, st='GTP', act='N', braf=1) % RAF(st='U', ser295='U', b=1),
          *par['RASGTP_RAF_cat'])
 
-    # Deactivation of RAF:P -> RAF by PP1
-    catalyze(PP1(), 'b', RAF(st='P', ser295='U'), 'b', RAF(st='U', ser295='U'),
-             (par['RAFP_PP1']))
-
-    # Activation of MEK -> MEK:P by activated RAF
-    catalyze(RAF(st='P', ser295='U'), 'b', MEK(st='U'), 'b', MEK(st='P'),
-             (par['RAFP_MEK']))
-
-    # Deactivation of MEK:P -> MEK by PP2
-    catalyze(PP2(), 'b', MEK(st='P'), 'b', MEK(st='U'),
-             (par['MEKP_PP2']))
-
-    # Activation of MEK:P -> MEK:P:P by activated RAF
-    catalyze(RAF(st='P', ser295='U'), 'b', MEK(st='P'), 'b', MEK(st='PP'),
-             (par['RAFP_MEKP']))
-
-    # Deactivation of MEK:P:P -> MEK:P by PP2
-    catalyze(PP2(), 'b', MEK(st='PP'), 'b', MEK(st='P'),
-             (par['MEKPP_PP2']))
-
-    # Activation of ERK -> ERK:P by activated MEK:P:P
-    catalyze(MEK(st='PP'), 'b', ERK(st='U'), 'b', ERK(st='P'),
-             (par['MEKPP_ERK']))
-
-    # Deactivation of ERK:P -> ERK by PP3
-    catalyze(PP3(), 'b', ERK(st='P'), 'b', ERK(st='U'),
-             (par['ERKP_PP3']))
-
-    # Activation of ERK:P -> ERK:P:P by activated MEK:P:P
-    catalyze(MEK(st='PP'), 'b', ERK(st='P'), 'b', ERK(st='PP'),
-             (par['MEKPP_ERKP']))
-
-    # Deactivation of ERK:P:P -> ERK:P by PP3
-    catalyze(PP3(), 'b', ERK(st='PP'), 'b', ERK(st='P'),
-             (par['ERKPP_PP3']))
+    # RAF/MEK/ERK (de)phosphorylation cascade: (enzyme, substrate, product, parameter key)
+    RAFP = RAF(st='P', ser295='U')
+    mapk_cascade = [(PP1(), RAFP, RAF(st='U', ser295='U'), 'RAFP_PP1'),    # RAF:P -> RAF by PP1
+                    (RAFP, MEK(st='U'), MEK(st='P'), 'RAFP_MEK'),          # MEK -> MEK:P by activated RAF
+                    (PP2(), MEK(st='P'), MEK(st='U'), 'MEKP_PP2'),         # MEK:P -> MEK by PP2
+                    (RAFP, MEK(st='P'), MEK(st='PP'), 'RAFP_MEKP'),        # MEK:P -> MEK:P:P by activated RAF
+                    (PP2(), MEK(st='PP'), MEK(st='P'), 'MEKPP_PP2'),       # MEK:P:P -> MEK:P by PP2
+                    (MEK(st='PP'), ERK(st='U'), ERK(st='P'), 'MEKPP_ERK'), # ERK -> ERK:P by activated MEK:P:P
+                    (PP3(), ERK(st='P'), ERK(st='U'), 'ERKP_PP3'),         # ERK:P -> ERK by PP3
+                    (MEK(st='PP'), ERK(st='P'), ERK(st='PP'), 'MEKPP_ERKP'),  # ERK:P -> ERK:P:P by activated MEK:P:P
+                    (PP3(), ERK(st='PP'), ERK(st='P'), 'ERKPP_PP3')]       # ERK:P:P -> ERK:P by PP3
+    for enz, sub, prod, key in mapk_cascade:
+        catalyze(enz, 'b', sub, 'b', prod, par[key])
 
     # Degradation of PP3
     degrade(PP3(b=None), par['PP3_deg'])
@@ -571,7 +545,7 @@ def akt_monomers():
     """ This is the akt part of the pathway from the Chen et al. 2009 paper.  Initial rules for all binding reactions were generated and then coded again using macros and higher order macros.  Initial parameters and conditions were taken from Chen et al. 2009 paper and supplementary, but were later modified in order to get the model working correctly.  This pathway follows AKT from its initial state to a phosphorylated and then double phosphorylated state before returning to unphosphorylated AKT.  The model works correctly, but parameters and rates may need to be modified in order to get best fit.  Parameters and rates included are from trial and error of what best fit the model.  The last unbinding reactions may not be needed because of the catalyze_state macros, but were left in just in case these are needed later.  
 """
     #This pathway coded by Tim O'Brien.
-    Monomer('GAB1', ['bgrb2', 'bshp2', 'bpi3k', 'bpi3k2', 'bpi3k3', 'bpi3k4', 'bpi3k5', 'bpi3k6','batp','bERKPP','bPase9t','S'],{'S':['U','P','PP']})
+    Monomer('GAB1', ['bgrb2', 'bshp2', 'bpi3k', 'batp','bERKPP','bPase9t','S'],{'S':['U','P','PP']})
     Monomer('PI3K',['bgab1','bpip', 'bras', 'berb'])
     Monomer('SHP2',['bgab1'])
     Monomer('PIP', ['bakt', 'both', 'S', 'bpi3k_self','bself2'], {'S':['PIP2', 'PIP3']})
@@ -584,10 +558,8 @@ def akt_monomers():
 def akt_initial():
     # See parameter dictionary files for given cell type for initial values.
     
-    alias_model_components()
-    
     # Initial conditions 
-    Initial(GAB1(bgrb2=None, bshp2=None, bpi3k=None, bpi3k2=None, bpi3k3=None, bpi3k4=None, bpi3k5=None, bpi3k6=None, batp=None, bERKPP=None, bPase9t=None, S='U'), GAB1_0)
+    Initial(GAB1(bgrb2=None, bshp2=None, bpi3k=None, batp=None, bERKPP=None, bPase9t=None, S='U'), GAB1_0)
     Initial(PI3K(bgab1=None, bpip=None, bras=None, berb=None), PI3K_0)
     Initial(SHP2(bgab1=None), SHP2_0)
     Initial(PIP(bakt=None, both=None, S='PIP2', bpi3k_self=None, bself2=None), PIP_0)
@@ -596,46 +568,57 @@ def akt_initial():
     Initial(AKT(bpip3=None, both=None, S='U'), AKT_0)
     Initial(PDK1(bakt=None, both=None), PDK1_0)
     Initial(PP2A_III(bakt=None, both=None), PP2A_III_0)
-def akt_events():
+# Receptor dimers that differ only in their Chen/Sorger rate constants.
+# Rows are (rule name, ty1, ty2, loc, parameter key); loc None matches either membrane.
+# Row order is rule order, which fixes the BNG species numbering behind the stored y0 files.
+#Rate 1 (GRB2_bind_GAP_2): ErbB1/ErbB1 and ErbB2/ErbB2 dimers (endosomal and plasma membrane), ErbB2/ErbB3 dimers (plasma membrane), and ErbB2/ErbB4 dimers (endosomal membrane)
+#Rate 2 (GRB2_bind_GAP): ErbB1/ErbBX, X=2, 3, 4 (endosomal and plasma membrane), ErbB2/ErbB3 dimers (endosomal membrane), and ErbB2/ErbB4 dimers (plasma membrane)
+_GRB2_GAP_TABLE = [('GRB2_bind_GAP_2', '_1', '_1', None, 'GRB2_bind_GAP_2'),
+                   ('GRB2_bind_GAP_3', '_2', '_2', None, 'GRB2_bind_GAP_2'),
+                   ('GRB2_bind_GAP_4', '_2', '_3', 'C', 'GRB2_bind_GAP_2'),
+                   ('GRB2_bind_GAP_5', '_4', '_2', 'E', 'GRB2_bind_GAP_2')] + \
+                  [('GRB2_bind_GAP_6_'+i, '_1', i, None, 'GRB2_bind_GAP') for i in ['_2', '_3', '_4']] + \
+                  [('GRB2_bind_GAP_7', '_2', '_3', 'E', 'GRB2_bind_GAP'),
+                   ('GRB2_bind_GAP_8', '_2', '_4', 'C', 'GRB2_bind_GAP')]
+
+#Rate 1: ErbB1/ErbB1, ErbB1/ErbB2, ErbB1/ErbB4, and ErbB2/ErbB4 dimers; Rate 2: ErbB1/ErbB3, ErbB2/ErbB2, and ErbB2/ErbB3 dimers
+_GAB1_PI3K_TABLE = [('GAB1_bind_PI3K_1_'+i, '_1', i, 'GAB1_bind_PI3K_1') for i in ['_1', '_2', '_4']] + \
+                   [('GAB1_bind_PI3K_2', '_2', '_4', 'GAB1_bind_PI3K_1')] + \
+                   [('GAB1_bind_PI3K_3_'+i, i, '_3', 'GAB1_bind_PI3K_2') for i in ['_1', '_2']] + \
+                   [('GAB1_bind_PI3K_4', '_2', '_2', 'GAB1_bind_PI3K_2')]
+
+#Rate 1: ErbB1/ErbBX dimers; Rate 2: ErbB2/ErbBX dimers, X=2, 3, 4
+_PIP2_PI3K_BIND_TABLE = [('PIP2_bind_PI3K_1_'+i, '_1', i, 'PIP2_bind_PI3K_1') for i in ['_1', '_2', '_3', '_4']] + \
+                        [('PIP2_bind_PI3K_2_'+i, '_2', i, 'PIP2_chain_PI3K') for i in ['_2', '_3', '_4']]
+
+#Rate 1: ErbB2/ErbB3 dimers; Rate 2: all other dimers
+_PIP2_PI3K_CAT_TABLE = [('PIP2_PI3K_catalysis_1', '_2', '_3', 'PIP2_self_catalysis')] + \
+                       [('PIP2_PI3K_catalysis_2_'+i, '_1', i, 'PIP2_PI3K_catalysis') for i in ['_1', '_2', '_3', '_4']] + \
+                       [('PIP2_PI3K_catalysis_3_'+i, '_2', i, 'PIP2_PI3K_catalysis') for i in ['_2', '_4']]
+
+def _erbb_dimer(ty1, ty2, bd, loc=None):
+    """Receptor dimer prefix erbb(ty1) % erbb(ty2), restricted to one membrane if loc is given."""
+    site = {} if loc is None else {'loc': loc}
+    return erbb(bd=bd, ty=ty1, **site) % erbb(bd=bd, ty=ty2, **site)
+
+def _pdk1_catalysis(name, s_in, s_out, bind_rates, kcat):
+    """PDK1 binds PIP3-bound AKT (S=s_in) and phosphorylates it to s_out, leaving PDK1 on the PIP3."""
+    bind(PDK1(both=None), 'bakt', AKT(bpip3=ANY, S=s_in), 'both', bind_rates)
+    Rule(name,
+         PDK1(both=None, bakt=1) % AKT(bpip3=2, S=s_in, both=1) % PIP(S='PIP3', both=None, bpi3k_self=None, bakt=2) >>
+         PDK1(both=3, bakt=None) % PIP(S='PIP3', both=3, bpi3k_self=None, bakt=None) + AKT(bpip3=None, S=s_out, both=None),
+         kcat)
+
+def _akt_grb2_gap():
+    """GRB2 binding to the GAP-receptor complex."""
     #GRB2 binds GAP-complex (without requiring SHC bound to complex):
-    #Bind GRB2 without SOS already bound (two Chen-Sorger rate constants for different receptor dimers):
-    #Rate 1: ErbB1/ErbB1 dimers (endosomal and plasma membrane), ErbB2/ErbB2 dimers (endosomal and plasma membrane), ErbB2/ErbB3 dimers (plasma membrane), and ErbB2/ErbB4 dimers (endosomal membrane):
-    Rule('GRB2_bind_GAP_2',
-         erbb(bd=1, ty='_1') % erbb(bd=1, ty='_1') % GAP(bd=ANY, b=None, bgrb2=None) + GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=None) |
-         erbb(bd=1, ty='_1') % erbb(bd=1, ty='_1') % GAP(bd=ANY, b=None, bgrb2=2) % GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=2),
-         *par['GRB2_bind_GAP_2'])
-
-    Rule('GRB2_bind_GAP_3',
-         erbb(bd=1, ty='_2') % erbb(bd=1, ty='_2') % GAP(bd=ANY, b=None, bgrb2=None) + GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=None) |
-         erbb(bd=1, ty='_2') % erbb(bd=1, ty='_2') % GAP(bd=ANY, b=None, bgrb2=2) % GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=2),
-         *par['GRB2_bind_GAP_2'])
-    
-    Rule('GRB2_bind_GAP_4',
-         erbb(bd=1, ty='_2', loc='C') % erbb(bd=1, ty='_3', loc='C') % GAP(bd=ANY, b=None, bgrb2=None) + GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=None) |
-         erbb(bd=1, ty='_2', loc='C') % erbb(bd=1, ty='_3', loc='C') % GAP(bd=ANY, b=None, bgrb2=2) % GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=2),
-         *par['GRB2_bind_GAP_2'])
-
-    Rule('GRB2_bind_GAP_5',
-          erbb(bd=1, ty='_4', loc='E') % erbb(bd=1, ty='_2', loc='E') % GAP(bd=ANY, b=None, bgrb2=None) + GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=None) |
-          erbb(bd=1, ty='_4', loc='E') % erbb(bd=1, ty='_2', loc='E') % GAP(bd=ANY, b=None, bgrb2=2) % GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=2),
-          *par['GRB2_bind_GAP_2'])
-
-    #Rate 2: ErbB1/ErbBX, X=2, 3, 4 (endosomal and plasma membrane), ErbB2/ErbB3 dimers (endosomal membrane), and ErbB2/ErbB4 dimers (plasma membrane):
-    for i in ['_2', '_3', '_4']:
-        Rule('GRB2_bind_GAP_6_'+i,
-        erbb(bd=1, ty='_1') % erbb(bd=1, ty=i) % GAP(bd=ANY, b=None, bgrb2=None) + GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=None) |
-        erbb(bd=1, ty='_1') % erbb(bd=1, ty=i) % GAP(bd=ANY, b=None, bgrb2=2) % GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=2),
-        *par['GRB2_bind_GAP'])
-
-    Rule('GRB2_bind_GAP_7',
-         erbb(bd=1, ty='_2', loc='E') % erbb(bd=1, ty='_3', loc='E') % GAP(bd=ANY, b=None, bgrb2=None) + GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=None) |
-         erbb(bd=1, ty='_2', loc='E') % erbb(bd=1, ty='_3', loc='E') % GAP(bd=ANY, b=None, bgrb2=2) % GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=2),
-         *par['GRB2_bind_GAP'])
-
-    Rule('GRB2_bind_GAP_8',
-         erbb(bd=1, ty='_2', loc='C') % erbb(bd=1, ty='_4', loc='C') % GAP(bd=ANY, b=None, bgrb2=None) + GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=None) |
-         erbb(bd=1, ty='_2', loc='C') % erbb(bd=1, ty='_4', loc='C') % GAP(bd=ANY, b=None, bgrb2=2) % GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=2),
-         *par['GRB2_bind_GAP'])
+    #Bind GRB2 without SOS already bound (two Chen-Sorger rate constants for different receptor dimers, see _GRB2_GAP_TABLE):
+    for name, ty1, ty2, loc, key in _GRB2_GAP_TABLE:
+        dimer = _erbb_dimer(ty1, ty2, 1, loc)
+        Rule(name,
+             dimer % GAP(bd=ANY, b=None, bgrb2=None) + GRB2_free |
+             dimer % GAP(bd=ANY, b=None, bgrb2=2) % GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=2),
+             *par[key])
 
     #Bind GRB2 to GAP with SOS already bound (one rate constant set for all dimer combinations):
     Rule('GRB2_bind_GAP_1',
@@ -643,6 +626,8 @@ def akt_events():
          GAP(bd=ANY, b=None, bgrb2=2) % GRB2(b=None, bsos=1, bgab1=None, bcpp=None, bgap=2) % SOS(bras=None, bERKPP=None, st='U', bgrb=1),
          *par['GRB2_SOS_bind_GAP'])
 
+def _akt_gab1():
+    """GAB1 recruitment and phosphorylation, and PI3K binding to GAB1:P."""
     #GAB1 binds GAP-GRB2. Specify plasma membrane complexes in order to prevent complex building on endosomal receptors, so that degradation rxns (above in receptor events) can be simplified -- GAB1 complexes are not degraded as per Chen/Sorger model 
 
     Rule('GRB2_bind_GAB1',
@@ -652,50 +637,36 @@ def akt_events():
     
     #GAP-GRB2-GAB1 phosphorylation - Rates from Table p. 5 Chen et al 2009
     Rule('GAB1_bind_ATP',
-         GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=None, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='U') + ATP(b=None) |
-         GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=None, batp=1, bERKPP=None, bPase9t=None, bgrb2=ANY, S='U') % ATP(b=1),
+         GAP_GRB2 % GAB1(bshp2=None, bpi3k=None, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='U') + ATP_free |
+         GAP_GRB2 % GAB1(bshp2=None, bpi3k=None, batp=1, bERKPP=None, bPase9t=None, bgrb2=ANY, S='U') % ATP(b=1),
          *par['GAB1_bind_ATP'])
 
     Rule('GAB1_phos',
-         GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=None, batp=1, bERKPP=None, bPase9t=None, bgrb2=ANY, S='U') % ATP(b=1) >>
-         GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=None, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') + ADP(),
+         GAP_GRB2 % GAB1(bshp2=None, bpi3k=None, batp=1, bERKPP=None, bPase9t=None, bgrb2=ANY, S='U') % ATP(b=1) >>
+         GAP_GRB2 % GAB1P_free + ADP(),
          par['GAB1_phos'])
 
     #SHP2 can desphosphorylate GAB1-P
     catalyze_state(SHP2(), 'bgab1', GAB1(bgrb2=ANY, bpi3k=None, batp=None, bERKPP=None, bPase9t=None), 'bshp2', 'S', 'P', 'U', (par['SHP2_dephos_GAB1P']))
    
     #After GAB1 phosphorylation, all receptor dimer combinations can bind a single PI3K
-    #Chen/Sorger model gives two rate constant sets for different receptor dimers:
-    #Rate 1: ErbB1/ErbB1, ErbB1/ErbB2, ErbB1/ErbB4, and ErbB2/ErbB4 dimers:
-    for i in ['_1', '_2', '_4']:
-        Rule('GAB1_bind_PI3K_1_'+i,
-             erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty=i) % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=None, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') + PI3K(bpip=None, bgab1=None, bras=None) |
-             erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty=i) % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=1, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=None, bgab1=1, bras=None),
-             *par['GAB1_bind_PI3K_1'])
-
-    Rule('GAB1_bind_PI3K_2',
-         erbb(bd=ANY, ty='_2') % erbb(bd=ANY, ty='_4') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=None, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') + PI3K(bpip=None, bgab1=None, bras=None) |
-             erbb(bd=ANY, ty='_2') % erbb(bd=ANY, ty='_4') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=1, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=None, bgab1=1, bras=None),
-             *par['GAB1_bind_PI3K_1'])
-
-    #Rate 2: ErbB1/ErbB3, ErbB2/ErbB2, and ErbB2/ErbB3 dimers:
-    for i in ['_1', '_2']:
-        Rule('GAB1_bind_PI3K_3_'+i,
-             erbb(bd=ANY, ty=i) % erbb(bd=ANY, ty='_3') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=None, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') + PI3K(bpip=None, bgab1=None, bras=None) |
-             erbb(bd=ANY, ty=i) % erbb(bd=ANY, ty='_3') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=1, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=None, bgab1=1, bras=None),
-             *par['GAB1_bind_PI3K_2'])
-
-    Rule('GAB1_bind_PI3K_4',
-             erbb(bd=ANY, ty='_2') % erbb(bd=ANY, ty='_2') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=None, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') + PI3K(bpip=None, bgab1=None, bras=None) |
-             erbb(bd=ANY, ty='_2') % erbb(bd=ANY, ty='_2') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=1, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=None, bgab1=1, bras=None),
-             *par['GAB1_bind_PI3K_2'])
-
+    #Chen/Sorger model gives two rate constant sets for different receptor dimers, see _GAB1_PI3K_TABLE:
+    GAB1P_bound = GAB1(bshp2=None, bpi3k=1, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P')
+    for name, ty1, ty2, key in _GAB1_PI3K_TABLE:
+        dimer = _erbb_dimer(ty1, ty2, ANY)
+        Rule(name,
+             dimer % GAP_GRB2 % GAB1P_free + PI3K(bpip=None, bgab1=None, bras=None) |
+             dimer % GAP_GRB2 % GAB1P_bound % PI3K(bpip=None, bgab1=1, bras=None),
+             *par[key])
+
+def _akt_pip_chain():
+    """PIP2 chains on PI3K and PIP2 -> PIP3 catalysis."""
     #GAB1-PI3K bound to complex containing ErbB2/ErbB3 binds 1-6 PIP2 (creates chains; doesn't necessarily represent biology but accurately reproduces Chen Sorger 2009 model).
     #First bind a single PIP2 to PI3K complex - this rule created by catalyze_state below
 
     #Then create chains of up to 6 PIP2 molecules attached to a single PI3K:
     assemble_chain_sequential_base(PI3K(berb=None, bras=None, bgab1=ANY, bpip=None), 'bpip', PIP(bakt=None, both=None, S='PIP2'), 'bpi3k_self', 'bself2', 6, [par['PIP2_chain_PI3K']]*5, \
-                                   erbb(bd=ANY, ty='_2', b=ANY, loc='C') % erbb(bd=ANY, ty='_3', b=None, loc='C') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P'))
+                                   erbb(bd=ANY, ty='_2', b=ANY, loc='C') % erbb(bd=ANY, ty='_3', b=None, loc='C') % GAP_GRB2 % GAB1P_PI3K)
     
     #To accurately reproduce Chen Sorger model, allow PIP2 to catalyze PIP2->PIP3 conversion of final chain unit.
     Rule('PIP2_self_catalysis_1',
@@ -720,88 +691,122 @@ def akt_events():
     
 
     #PI3K bound to complex catalyzes PIP2 -> PIP3
-    #Two rate sets for initial binding in Chen/Sorger model:
-    #Rate 1: ErbB1/ErbBX dimers:
-    for i in ['_1', '_2', '_3', '_4']:
-        Rule('PIP2_bind_PI3K_1_'+i,
-             erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty=i) % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=None, bgab1=ANY, bras=None) + PIP(S='PIP2', both=None, bakt=None, bself2=None, bpi3k_self=None) |
-             erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty=i) % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=1, bgab1=ANY, bras=None) % PIP(S='PIP2', both=None, bakt=None, bself2=None, bpi3k_self=1),
-             *par['PIP2_bind_PI3K_1'])
-
-    #Rate 2: ErbB2/ErbBX dimers, X=2, 3, 4:
+    #Two rate sets for initial binding in Chen/Sorger model, see _PIP2_PI3K_BIND_TABLE:
     #FIXME: What is up with v701 in reaction list?
-    for i in ['_2', '_3', '_4']:
-        Rule('PIP2_bind_PI3K_2_'+i,
-        erbb(bd=ANY, ty='_2') % erbb(bd=ANY, ty=i) % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=None, bgab1=ANY, bras=None) + PIP(S='PIP2', both=None, bakt=None, bself2=None, bpi3k_self=None) |
-        erbb(bd=ANY, ty='_2') % erbb(bd=ANY, ty=i) % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=1, bgab1=ANY, bras=None) % PIP(S='PIP2', both=None, bakt=None, bself2=None, bpi3k_self=1),
-             *par['PIP2_chain_PI3K'])
-    
-    #Two catalysis rates in Chen/Sorger model:
-    #Rate 1: ErbB2/ErbB3 dimers:
-    Rule('PIP2_PI3K_catalysis_1',
-         erbb(bd=ANY, ty='_2') % erbb(bd=ANY, ty='_3') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=1, bgab1=ANY, bras=None) % PIP(S='PIP2', both=None, bakt=None, bself2=None, bpi3k_self=1) >>
-         erbb(bd=ANY, ty='_2') % erbb(bd=ANY, ty='_3') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=None, bgab1=ANY, bras=None) + PIP(S='PIP3', both=None, bakt=None, bself2=None, bpi3k_self=None),
-         par['PIP2_self_catalysis'])
-
-    #Rate 2: All other dimers:
-    for i in ['_1', '_2', '_3', '_4']:
-        Rule('PIP2_PI3K_catalysis_2_'+i,
-             erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty=i) % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=1, bgab1=ANY, bras=None) % PIP(S='PIP2', both=None, bakt=None, bself2=None, bpi3k_self=1) >>
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty=i) % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=None, bgab1=ANY, bras=None) + PIP(S='PIP3', both=None, bakt=None, bself2=None, bpi3k_self=None),
-         par['PIP2_PI3K_catalysis'])
-
-    for i in ['_2', '_4']:
-        Rule('PIP2_PI3K_catalysis_3_'+i,
-             erbb(bd=ANY, ty='_2') % erbb(bd=ANY, ty=i) % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=1, bgab1=ANY, bras=None) % PIP(S='PIP2', both=None, bakt=None, bself2=None, bpi3k_self=1) >>
-         erbb(bd=ANY, ty='_2') % erbb(bd=ANY, ty=i) % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY) % GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P') % PI3K(bpip=None, bgab1=ANY, bras=None) + PIP(S='PIP3', both=None, bakt=None, bself2=None, bpi3k_self=None),
-         par['PIP2_PI3K_catalysis'])
-             
-     # Setting up the binding reactions necessary for AKT to be phosphorylated and move through the pathway
+    PI3K_free = PI3K(bpip=None, bgab1=ANY, bras=None)
+    PI3K_PIP2 = PI3K(bpip=1, bgab1=ANY, bras=None) % PIP(S='PIP2', both=None, bakt=None, bself2=None, bpi3k_self=1)
+    for name, ty1, ty2, key in _PIP2_PI3K_BIND_TABLE:
+        prefix = _erbb_dimer(ty1, ty2, ANY) % GAP_GRB2 % GAB1P_PI3K
+        Rule(name,
+             prefix % PI3K_free + PIP(S='PIP2', both=None, bakt=None, bself2=None, bpi3k_self=None) |
+             prefix % PI3K_PIP2,
+             *par[key])
+
+    #Two catalysis rates in Chen/Sorger model, see _PIP2_PI3K_CAT_TABLE:
+    for name, ty1, ty2, key in _PIP2_PI3K_CAT_TABLE:
+        prefix = _erbb_dimer(ty1, ty2, ANY) % GAP_GRB2 % GAB1P_PI3K
+        Rule(name,
+             prefix % PI3K_PIP2 >>
+             prefix % PI3K_free + PIP(S='PIP3', both=None, bakt=None, bself2=None, bpi3k_self=None),
+             par[key])
+
+def _akt_pdk1():
+    """AKT binding to PIP3 and its phosphorylation by PDK1."""
+    # Rate constants shared by several rules below
+    p_pip3_akt, p_akt_pdk1 = par['PIP3_bind_AKT'], par['AKT_PIP3_bind_PDK1']
+
+    # Setting up the binding reactions necessary for AKT to be phosphorylated and move through the pathway
     bind_table([[                                                 AKT(S='U', both=None),       AKT(S='P', both=None)],
-                [PIP(S='PIP3', both=None, bpi3k_self=None),       (par['PIP3_bind_AKT']),     (par['PIP3_bind_AKT'])]],
+                [PIP(S='PIP3', both=None, bpi3k_self=None),       (p_pip3_akt),     (p_pip3_akt)]],
                 'bakt', 'bpip3')
     
     # AKT-PIP3 is phosphorylated by PDK1 to AKTP; PDK1-PIP3 and AKTP are released
-    bind(PDK1(both=None), 'bakt', AKT(bpip3=ANY, S='U'), 'both', par['AKT_PIP3_bind_PDK1'])
-    
-    Rule('PDK1_AKT_catalysis',
-         PDK1(both=None, bakt=1) % AKT(bpip3=2, S='U', both=1) % PIP(S='PIP3', both=None, bpi3k_self=None, bakt=2) >>
-         PDK1(both=3, bakt=None) % PIP(S='PIP3', both=3, bpi3k_self=None, bakt=None) + AKT(bpip3=None, S='P', both=None),
-         par['PDK1_AKT_catalysis'])
+    _pdk1_catalysis('PDK1_AKT_catalysis', 'U', 'P', p_akt_pdk1, par['PDK1_AKT_catalysis'])
 
     # PIP3 unbinds PDK1
     bind(PIP(S='PIP3', bakt=None, bpi3k_self=None), 'both', PDK1(bakt=None), 'both', par['PIP3_bind_PDK1'])
 
     # AKTP-PIP3 is phosphorylated by PDK1 to AKTPP
-    bind(PDK1(both=None), 'bakt', AKT(bpip3=ANY, S='P'), 'both', par['AKT_PIP3_bind_PDK1'])
-    
-    Rule('PDK1_AKTP_catalysis',
-         PDK1(both=None, bakt=1) % AKT(bpip3=2, S='P', both=1) % PIP(S='PIP3', both=None, bpi3k_self=None, bakt=2) >>
-         PDK1(both=3, bakt=None) % PIP(S='PIP3', both=3, bpi3k_self=None, bakt=None) + AKT(bpip3=None, S='PP', both=None),
-         par['PDK1_AKTP_catalysis'])
-
-    # AKTP is dephosphorylated by PP2A-III back to AKT
-    catalyze_state(PP2A_III, 'bakt', AKT(bpip3=None), 'both', 'S', 'P', 'U',(par['AKTP_dephos']))
-   
-    # AKTPP is dephosphorylated by PP2A-III back to AKTP
-    catalyze_state(PP2A_III, 'bakt', AKT(bpip3=None), 'both', 'S', 'PP', 'P',(par['AKTPP_dephos']))
+    _pdk1_catalysis('PDK1_AKTP_catalysis', 'P', 'PP', p_akt_pdk1, par['PDK1_AKTP_catalysis'])
+
+def _akt_pases():
+    """AKT and PIP3 dephosphorylation."""
+    # Dephosphorylations: (enzyme, enzyme site, substrate, substrate site, state in, state out, parameter key)
+    # AKTP and AKTPP are dephosphorylated by PP2A-III; PIP3 is dephosphorylated to PIP2 by PTEN and by SHP
+    dephos_table = [(PP2A_III, 'bakt', AKT(bpip3=None), 'both', 'P', 'U', 'AKTP_dephos'),
+                    (PP2A_III, 'bakt', AKT(bpip3=None), 'both', 'PP', 'P', 'AKTPP_dephos'),
+                    (PTEN, 'bpip3', PIP(bakt=None, bpi3k_self=None), 'both', 'PIP3', 'PIP2', 'PIP3_dephos'),
+                    (SHP, 'bpip3', PIP(bakt=None, bpi3k_self=None), 'both', 'PIP3', 'PIP2', 'PIP3_dephos')]
+    for enz, e_site, sub, s_site, s_in, s_out, key in dephos_table:
+        catalyze_state(enz, e_site, sub, s_site, 'S', s_in, s_out, par[key])
 
-    # PIP3 is dephosphorylated by PTEN to PIP2
-    catalyze_state(PTEN, 'bpip3', PIP(bakt=None, bpi3k_self=None), 'both', 'S', 'PIP3', 'PIP2', (par['PIP3_dephos']))
-
-    # PIP3 is dephosphorylated by SHP to PIP2
-    catalyze_state(SHP, 'bpip3', PIP(bakt=None, bpi3k_self=None), 'both', 'S', 'PIP3', 'PIP2', (par['PIP3_dephos']))
+def akt_events():
+    # Each stage runs in its own function, so its local patterns are released on return
+    _akt_grb2_gap()
+    _akt_gab1()
+    _akt_pip_chain()
+    _akt_pdk1()
+    _akt_pases()
+
+# Pattern zoo
+# ===========
+# MonomerPatterns that recur across the rule bodies, built once and shared by
+# reference; pattern operators never mutate their operands.
+
+def _pattern_zoo():
+    global ATP_free, SHCP_bound, GRB2_free, GRB2_SHC, GRB2_GAP, SOS_U_free, SOS_U_bound
+    global RAS_GDP, RAS_GDP_bound, RAS_GTP, RAS_GTP_bound, RAS_GTP_active
+    global GAP_GRB2, GAB1P_free, GAB1P_PI3K
+    ATP_free = ATP(b=None)
+    SHCP_bound = SHC(batp=None, st='P', bgrb=ANY, bgap=ANY)
+    GRB2_free = GRB2(b=None, bsos=None, bgab1=None, bcpp=None, bgap=None)
+    GRB2_SHC = GRB2(bgap=None, bgab1=None, b=ANY, bsos=1, bcpp=None)
+    GRB2_GAP = GRB2(bgap=ANY, bgab1=None, b=None, bsos=1, bcpp=None)
+    SOS_U_free = SOS(bras=None, bgrb=1, bERKPP=None, st='U')
+    SOS_U_bound = SOS(bras=2, bgrb=1, bERKPP=None, st='U')
+    RAS_GDP = RAS(braf=None, bsos=None, st='GDP', act='N', bpi3k=None)
+    RAS_GDP_bound = RAS(braf=None, bsos=2, st='GDP', act='N', bpi3k=None)
+    RAS_GTP = RAS(braf=None, bsos=None, st='GTP', act='N', bpi3k=None)
+    RAS_GTP_bound = RAS(braf=None, bsos=2, st='GTP', act='N', bpi3k=None)
+    RAS_GTP_active = RAS(braf=None, bsos=None, st='GTP', act='Y', bpi3k=None)
+    GAP_GRB2 = GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=ANY)
+    GAB1P_free = GAB1(bshp2=None, bpi3k=None, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P')
+    GAB1P_PI3K = GAB1(bshp2=None, bpi3k=ANY, batp=None, bERKPP=None, bPase9t=None, bgrb2=ANY, S='P')
 
 def crosstalk_monomers():
     Monomer('Pase9t', ['bgab1'])
+    # The crosstalk monomers are declared last, so this single call exposes every
+    # monomer and cell-type parameter to the *_events and *_initial functions.
     alias_model_components()
+    _pattern_zoo()
     
 def crosstalk_initial():
     Initial(Pase9t(bgab1=None), Pase9t_0)
 
+def _erkpp_sos_axis(suffix, adaptor, bsos):
+    """ERK:P:P binding and phosphorylation of SOS held by an ErbB1/ErbB1 adaptor complex,
+    and rebinding of SOS:P to that complex. adaptor(bsos) builds the complex down to GRB2;
+    bsos is the GRB2 SOS-site condition while SOS is held. Returns (name, rxn, rates) tuples.
+    """
+    p_bind, p_phos = par['ERKPP_phos_SOS'][0:2], par['ERKPP_phos_SOS'][2:]
+    dimer = erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1')
+    held = dimer % adaptor(bsos)
+    return [('ERKPP_bind_SOS_'+suffix,
+             held % SOS(bras=None, bgrb=ANY, bERKPP=None, st='U') + ERK(st='PP', b=None) |
+             held % SOS(bras=None, bgrb=ANY, bERKPP=1, st='U') % ERK(st='PP', b=1),
+             p_bind),
+            ('ERKPP_phos_SOS_'+suffix,
+             held % SOS(bras=None, bgrb=ANY, bERKPP=1, st='U') % ERK(st='PP', b=1) >>
+             held % SOS(bras=None, bgrb=ANY, bERKPP=None, st='P') + ERK(st='PP', b=None),
+             p_phos),
+            ('SOSP_bind_GRB2_'+suffix,
+             dimer % adaptor(None) + SOS(bras=None, bgrb=None, bERKPP=None, st='P') |
+             dimer % adaptor(1) % SOS(bras=None, bgrb=1, bERKPP=None, st='P'),
+             par['SOSP_bind_GRB2'])]
+
 def crosstalk_events():
     #ERK:P:P phosphorylates GAP-GRB2-GAB1:P (making it unable to bind PI3K)
-    catalyze_state(ERK(st='PP'), 'b', GAB1(bgrb2=ANY, bshp2=None, bpi3k=None, bpi3k2=None, bpi3k3=None, bpi3k4=None, bpi3k5=None, bpi3k6=None), 'bERKPP', 'S', 'P', 'PP', (par['ERKPP_phos_GAB1P']))
+    catalyze_state(ERK(st='PP'), 'b', GAB1(bgrb2=ANY, bshp2=None, bpi3k=None), 'bERKPP', 'S', 'P', 'PP', (par['ERKPP_phos_GAB1P']))
 
     #GAP-GRB2-GAB1:P:P is dephosphorylated by Pase9t
     catalyze_state(Pase9t(), 'bgab1', GAB1(bgrb2=ANY), 'bPase9t', 'S', 'PP', 'P', (par['Pase9t_dephos_GAB1PP']))
@@ -810,35 +815,12 @@ def crosstalk_events():
     #To conform with Chen/Sorger model, this only effects ErbB1/ErbB1 dimers containing SOS and free SOS, and phosphorylated SOS can only bind ErbB1/ErbB1 complexes, not free GRB2:
     catalyze_state(ERK(st='PP'), 'b', SOS(bgrb=None, bras=None), 'bERKPP', 'st', 'U', 'P', (par['ERKPP_phos_SOS']))
 
-    Rule('ERKPP_bind_SOS_1',
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=None) % SOS(bras=None, bgrb=ANY, bERKPP=None, st='U') + ERK(st='PP', b=None) |
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=None) % SOS(bras=None, bgrb=ANY, bERKPP=1, st='U') % ERK(st='PP', b=1),
-        *par['ERKPP_phos_SOS'][0:2])
-
-    Rule('ERKPP_bind_SOS_2',
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=ANY, bgrb2=None) % SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, bsos=ANY, bcpp=None, b=ANY) % SOS(bras=None, bERKPP=None, st='U', bgrb=ANY) + ERK(st='PP', b=None) |
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=ANY, bgrb2=None) % SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, bsos=ANY, bcpp=None, b=ANY) % SOS(bras=None, bERKPP=1, st='U', bgrb=ANY) % ERK(st='PP', b=1),
-        *par['ERKPP_phos_SOS'][0:2])
-
-    Rule('ERKPP_phos_SOS_1',
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=None) % SOS(bras=None, bgrb=ANY, bERKPP=1, st='U') % ERK(st='PP', b=1) >>
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=None) % SOS(bras=None, bgrb=ANY, bERKPP=None, st='P') + ERK(st='PP', b=None),
-         par['ERKPP_phos_SOS'][2])
-
-    Rule('ERKPP_phos_SOS_2',
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=ANY, bgrb2=None) % SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, bsos=ANY, bcpp=None, b=ANY) % SOS(bras=None, bERKPP=1, st='U', bgrb=ANY) % ERK(st='PP', b=1) >>
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=ANY, bgrb2=None) % SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, bsos=ANY, bcpp=None, b=ANY) % SOS(bras=None, bERKPP=None, st='P', bgrb=ANY) + ERK(st='PP', b=None),
-         par['ERKPP_phos_SOS'][2])
-
-    Rule('SOSP_bind_GRB2_1',
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=None, bgap=ANY, bgab1=None) + SOS(bras=None, bgrb=None, bERKPP=None, st='P') |
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=1, bgap=ANY, bgab1=None) % SOS(bras=None, bgrb=1, bERKPP=None, st='P'),
-         *par['SOSP_bind_GRB2'])
-
-    Rule('SOSP_bind_GRB2_2',
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=ANY, bgrb2=None) % SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, bsos=None, bcpp=None, b=ANY) + SOS(bras=None, bERKPP=None, st='P', bgrb=None) |
-         erbb(bd=ANY, ty='_1') % erbb(bd=ANY, ty='_1') % GAP(bd=ANY, b=ANY, bgrb2=None) % SHC(batp=None, st='P', bgrb=ANY, bgap=ANY) % GRB2(bgap=None, bgab1=None, bsos=1, bcpp=None, b=ANY) % SOS(bras=None, bERKPP=None, st='P', bgrb=1),
-         *par['SOSP_bind_GRB2'])
+    #GAP-GRB2 (suffix 1) and GAP-SHC:P-GRB2 (suffix 2) branches; rules are emitted kind by kind
+    erkpp_sos = [_erkpp_sos_axis('1', lambda bsos: GAP(bd=ANY, b=None, bgrb2=ANY) % GRB2(b=None, bsos=bsos, bgap=ANY, bgab1=None), None),
+                 _erkpp_sos_axis('2', lambda bsos: GAP(bd=ANY, b=ANY, bgrb2=None) % SHCP_bound % GRB2(bgap=None, bgab1=None, bsos=bsos, bcpp=None, b=ANY), ANY)]
+    for rules in zip(*erkpp_sos):
+        for name, rxn, rates in rules:
+            Rule(name, rxn, *rates)
 
     #AKT:P:P phosphorylates RAF:P at Ser295, preventing MEK phosphorylation.
     catalyze_state(AKT(S='PP', bpip3=None), 'both', RAF(st='P'), 'b', 'ser295', 'U', 'P', (par['AKTPP_phos_RAFP']))
@@ -1,10 +1,9 @@
 from pysb import *
-from collections import OrderedDict
 
 # Parameters for EGFR Model - A431 cells
 # Obtained from Chen-Sorger Jacobian files unless otherwise specified.
 # Commented values prefixed by 'c' are the variables names from Chen Sorger Jacobian files.
-parameter_dict = OrderedDict([
+parameter_dict = dict([
     ('initial_amounts', # Initial values for all starting species (in molecules/cell)
      [Parameter('erbb1_0', 1.08e6), #531
       Parameter('erbb2_0', 4.62e5), #c141
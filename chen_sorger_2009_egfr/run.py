@@ -1,10 +1,10 @@
-from erbb_exec import model
+from .erbb_exec import model
 import numpy as np
 #from pysb.integrate import odesolve
-from pysb.simulator import ScipyOdeSimulator
+# Numba-compiled mass-action RHS shared with the Rexer models
+from ..ems_egfr_plus_mtor.simulation import simulate
 
 t = np.linspace(0,2000, num=2000)
 
 #yout = odesolve(model, t, integrator='lsoda')
-solver = ScipyOdeSimulator(model, t, integrator='lsoda')
-solver.run()
+yout = simulate(model, t, method='LSODA')
@@ -4,81 +4,207 @@ Model of ErbB receptors, MAPK-Ras and Akt-PI3K pathways, based upon Chen Sorger
 
 
 from pysb import *
+from pysb.simulator import ScipyOdeSimulator, StochKitSimulator
+import os
+import threading
+import numpy as np
 import pickle
+from ..ems_egfr_plus_mtor import simulation
 
 #from egfr import shared
-Model()
-from . import chen_modules
-
-# Declare monomers
-chen_modules.rec_monomers()
-chen_modules.rec_monomers_lig_EGF()
-chen_modules.mapk_monomers()
-chen_modules.akt_monomers()
-chen_modules.crosstalk_monomers()
-
-# Generate the upstream and downstream sections
-chen_modules.rec_events()
-chen_modules.rec_events_lig_EGF()
-chen_modules.mapk_events()
-chen_modules.akt_events()
-chen_modules.crosstalk_events()
-
-# Initial protein concentrations
-chen_modules.rec_initial()
-chen_modules.rec_initial_lig_hEGF()
-chen_modules.mapk_initial()
-chen_modules.akt_initial()
-chen_modules.crosstalk_initial()
-
-#Declare observables
-Observable('obsAKTPP', AKT(bpip3=None, both=None, S='PP'))
-Observable('obsErbB1_P_CE', erbb(ty='1', st='P'))
-Observable('obsERKPP', ERK(st='PP'))
-Observable('obsRasGTP_sos', RAS(bsos=ANY, braf=None, bpi3k=None, st='GTP'))
-Observable('obsRASGTP', RAS(bsos=None, braf=None, bpi3k=None, st='GTP'))
-Observable('RafPP', RAF(b=None, st='P', ser295='U'))
-Observable('MekPP', MEK(b=None, st='PP'))
-Observable('ErbB_Grb2_Sos', erbb() % erbb() % GRB2(bsos=1) % SOS(bgrb=1))
-Observable('ErbB_Shc_Grb2_Sos', erbb() % erbb() % SHC(bgrb=1) % GRB2(b=1, bsos=2) % SOS(bgrb=2))
-
-# Observable('obsEGF', EGF())
-# Observable('obsErbB1_lig', erbb(bd=None, ty='1', st='U', bl=ANY))
-# Observable('obsErbB1_ErbB', erbb(bd=1, ty='1', st='U') % erbb(bd=1, st='U'))
-# Observable('obsErbB1_ErbB1', erbb(bd=1, ty='1', st='U') % erbb(bd=1, ty='1', st='U'))
-# Observable('obsErbB1_ErbB2', erbb(bd=1, ty='1', st='U') % erbb(bd=1, ty='2', st='U'))
-# Observable('obsErbB1_ErbB3', erbb(bd=1, ty='1', st='U') % erbb(bd=1, ty='3', st='U'))
-# Observable('obsErbB1_ErbB4', erbb(bd=1, ty='1', st='U') % erbb(bd=1, ty='4', st='U'))
-# Observable('obsErbB1_ErbB_ATP', erbb(bd=1, ty='1', st='U', b=2) % erbb(bd=1, st='U') % ATP(b=2))
-
-# Observable('obsErbB_GAP_GRB2', erbb(bd=1) % erbb(bd=1) % GAP(bgrb2=2) % GRB2(bgap=2, bsos=None))
-# Observable('obsErbB_GAP_GRB2_GAB1U', erbb(bd=1) % erbb(bd=1) % GAP(bgrb2=2) % GRB2(bgap=2, bgab1=3) % GAB1(bgrb2=3, S='U'))
-# Observable('obsErbB_GAP_GRB2_GAB1P', erbb(bd=1) % erbb(bd=1) % GAP(bgrb2=2) % GRB2(bgap=2, bgab1=3) % GAB1(bgrb2=3, S='P'))
-# Observable('obsErbB_GAP_GRB2_GAB1P_PI3K', erbb(bd=1) % erbb(bd=1) % GAP(bgrb2=2) % GRB2(bgap=2, bgab1=3) % GAB1(bgrb2=3, S='P', bpi3k=4) % PI3K(bgab1=4))
-# Observable('obsPIP3', PIP(S='PIP3'))
-# Observable('obsAKT_PIP3', AKT(bpip3=1, S='U') % PIP(S='PIP3', bakt=1))
-# Observable('obsAKTP', AKT(S='P'))
-
-# Observable('obsErbB_GAP_GRB2_SOS', erbb(bd=1) % erbb(bd=1) % GAP(bgrb2=2) % GRB2(bgap=2, bsos=3) % SOS(bras=None, bgrb=3, bERKPP=None, st='U'))
-# Observable('obsErbB_GAP_SHCP', erbb(bd=1) % erbb(bd=1) % GAP(bgrb2=None, b=2) % SHC(batp=None, st='P', bgrb=None, bgap=2))
-# Observable('obsErbB11_GAP_GRB2', erbb(bd=1, ty='1') % erbb(bd=1, ty='1') % GAP(bgrb2=2) % GRB2(bgap=2, bsos=None))
-# Observable('obsErbB12_GAP_GRB2', erbb(bd=1, ty='1') % erbb(bd=1, ty='2') % GAP(bgrb2=2) % GRB2(bgap=2, bsos=None))
-# Observable('obsErbB13_GAP_GRB2', erbb(bd=1, ty='1') % erbb(bd=1, ty='3') % GAP(bgrb2=2) % GRB2(bgap=2, bsos=None))
-# Observable('obsErbB14_GAP_GRB2', erbb(bd=1, ty='1') % erbb(bd=1, ty='4') % GAP(bgrb2=2) % GRB2(bgap=2, bsos=None))
-# Observable('obsErbB22_GAP_GRB2', erbb(bd=1, ty='2') % erbb(bd=1, ty='2') % GAP(bgrb2=2) % GRB2(bgap=2, bsos=None))
-# Observable('obsErbB23_GAP_GRB2', erbb(bd=1, ty='2') % erbb(bd=1, ty='3') % GAP(bgrb2=2) % GRB2(bgap=2, bsos=None))
-# Observable('obsErbB24_GAP_GRB2', erbb(bd=1, ty='2') % erbb(bd=1, ty='4') % GAP(bgrb2=2) % GRB2(bgap=2, bsos=None))
-# Observable('obsErbB22_GAP_GRB2_SOS', erbb(bd=1, ty='2') % erbb(bd=1, ty='2') % GAP(bgrb2=2) % GRB2(bgap=2, bsos=3) % SOS(bras=None, bgrb=3, bERKPP=None, st='U'))
-# Observable('obsErbB23_GAP_GRB2_SOS', erbb(bd=1, ty='2') % erbb(bd=1, ty='3') % GAP(bgrb2=2) % GRB2(bgap=2, bsos=3) % SOS(bras=None, bgrb=3, bERKPP=None, st='U'))
-# Observable('obsErbB24_GAP_GRB2_SOS', erbb(bd=1, ty='2') % erbb(bd=1, ty='4') % GAP(bgrb2=2) % GRB2(bgap=2, bsos=3) % SOS(bras=None, bgrb=3, bERKPP=None, st='U'))
-# Observable('obsErbB22_GAP_SHCP', erbb(bd=1, ty='2') % erbb(bd=1, ty='2') % GAP(bgrb2=None, b=2) % SHC(batp=None, st='P', bgrb=None, bgap=2))
-# Observable('obsErbB23_GAP_SHCP', erbb(bd=1, ty='2') % erbb(bd=1, ty='3') % GAP(bgrb2=None, b=2) % SHC(batp=None, st='P', bgrb=None, bgap=2))
-# Observable('obsErbB24_GAP_SHCP', erbb(bd=1, ty='2') % erbb(bd=1, ty='4') % GAP(bgrb2=None, b=2) % SHC(batp=None, st='P', bgrb=None, bgap=2))
-
-# with open('model_species', 'rb') as handle:
-#     model_species = pickle.loads(handle.read())
-# n = 1
-# for i in model_species:
-#     Observable('m'+str(n), i)
-#     n = n + 1
 
+# The built model is a pure function of these sources; simulation.cached_model keeps a
+# pickle of it under a hash of their contents so later imports skip the rule building.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SOURCES = [os.path.join(_HERE, name) for name in ('erbb_exec.py', 'chen_modules.py', 'parameter_dict_A431.py')]
+
+def build_model():
+    model = Model()
+    # The parameter dictionary's Parameters go into the model current at its import, so
+    # import it and chen_modules, which binds it, afresh for every build
+    chen_modules = simulation.import_fresh(__package__, 'parameter_dict_A431', 'chen_modules')
+
+    # Declare monomers
+    chen_modules.rec_monomers()
+    chen_modules.rec_monomers_lig_EGF()
+    chen_modules.mapk_monomers()
+    chen_modules.akt_monomers()
+    chen_modules.crosstalk_monomers()
+
+    # Generate the upstream and downstream sections
+    chen_modules.rec_events()
+    chen_modules.rec_events_lig_EGF()
+    chen_modules.mapk_events()
+    chen_modules.akt_events()
+    chen_modules.crosstalk_events()
+
+    # Initial protein concentrations
+    chen_modules.rec_initial()
+    chen_modules.rec_initial_lig_hEGF()
+    chen_modules.mapk_initial()
+    chen_modules.akt_initial()
+    chen_modules.crosstalk_initial()
+
+    #Declare observables
+    Observable('obsAKTPP', AKT(bpip3=None, both=None, S='PP'))
+    Observable('obsErbB1_P_CE', erbb(ty='1', st='P'))
+    Observable('obsERKPP', ERK(st='PP'))
+    Observable('obsRasGTP_sos', RAS(bsos=ANY, braf=None, bpi3k=None, st='GTP'))
+    Observable('obsRASGTP', RAS(bsos=None, braf=None, bpi3k=None, st='GTP'))
+    Observable('RafPP', RAF(b=None, st='P', ser295='U'))
+    Observable('MekPP', MEK(b=None, st='PP'))
+    Observable('ErbB_Grb2_Sos', erbb() % erbb() % GRB2(bsos=1) % SOS(bgrb=1))
+    Observable('ErbB_Shc_Grb2_Sos', erbb() % erbb() % SHC(bgrb=1) % GRB2(b=1, bsos=2) % SOS(bgrb=2))
+
+    return model
+
+def load_model(cache_dir=simulation.CACHE_DIR):
+    """The cached model, built on a miss; see simulation.cached_model.
+    Pass cache_dir=None to always build."""
+    return simulation.cached_model(build_model, _SOURCES, 'simplified_model', cache_dir)
+
+model = load_model()
+
+# Further observables, left out of the model by default since each one is another
+# output column filled every step; register them with add_observables. The patterns
+# take model.monomers, so they apply to whichever model load_model returned.
+OBSERVABLE_DEFS = {
+    'obsEGF': lambda m: m.EGF(),
+    'obsErbB1_lig': lambda m: m.erbb(bd=None, ty='1', st='U', bl=ANY),
+    'obsErbB1_ErbB': lambda m: m.erbb(bd=1, ty='1', st='U') % m.erbb(bd=1, st='U'),
+    'obsErbB1_ErbB1': lambda m: m.erbb(bd=1, ty='1', st='U') % m.erbb(bd=1, ty='1', st='U'),
+    'obsErbB1_ErbB2': lambda m: m.erbb(bd=1, ty='1', st='U') % m.erbb(bd=1, ty='2', st='U'),
+    'obsErbB1_ErbB3': lambda m: m.erbb(bd=1, ty='1', st='U') % m.erbb(bd=1, ty='3', st='U'),
+    'obsErbB1_ErbB4': lambda m: m.erbb(bd=1, ty='1', st='U') % m.erbb(bd=1, ty='4', st='U'),
+    'obsErbB1_ErbB_ATP': lambda m: m.erbb(bd=1, ty='1', st='U', b=2) % m.erbb(bd=1, st='U') % m.ATP(b=2),
+
+    'obsErbB_GAP_GRB2': lambda m: m.erbb(bd=1) % m.erbb(bd=1) % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=None),
+    'obsErbB_GAP_GRB2_GAB1U': lambda m: m.erbb(bd=1) % m.erbb(bd=1) % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bgab1=3) % m.GAB1(bgrb2=3, S='U'),
+    'obsErbB_GAP_GRB2_GAB1P': lambda m: m.erbb(bd=1) % m.erbb(bd=1) % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bgab1=3) % m.GAB1(bgrb2=3, S='P'),
+    'obsErbB_GAP_GRB2_GAB1P_PI3K': lambda m: m.erbb(bd=1) % m.erbb(bd=1) % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bgab1=3) % m.GAB1(bgrb2=3, S='P', bpi3k=4) % m.PI3K(bgab1=4),
+    'obsPIP3': lambda m: m.PIP(S='PIP3'),
+    'obsAKT_PIP3': lambda m: m.AKT(bpip3=1, S='U') % m.PIP(S='PIP3', bakt=1),
+    'obsAKTP': lambda m: m.AKT(S='P'),
+
+    'obsErbB_GAP_GRB2_SOS': lambda m: m.erbb(bd=1) % m.erbb(bd=1) % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=3) % m.SOS(bras=None, bgrb=3, bERKPP=None, st='U'),
+    'obsErbB_GAP_SHCP': lambda m: m.erbb(bd=1) % m.erbb(bd=1) % m.GAP(bgrb2=None, b=2) % m.SHC(batp=None, st='P', bgrb=None, bgap=2),
+    'obsErbB11_GAP_GRB2': lambda m: m.erbb(bd=1, ty='1') % m.erbb(bd=1, ty='1') % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=None),
+    'obsErbB12_GAP_GRB2': lambda m: m.erbb(bd=1, ty='1') % m.erbb(bd=1, ty='2') % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=None),
+    'obsErbB13_GAP_GRB2': lambda m: m.erbb(bd=1, ty='1') % m.erbb(bd=1, ty='3') % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=None),
+    'obsErbB14_GAP_GRB2': lambda m: m.erbb(bd=1, ty='1') % m.erbb(bd=1, ty='4') % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=None),
+    'obsErbB22_GAP_GRB2': lambda m: m.erbb(bd=1, ty='2') % m.erbb(bd=1, ty='2') % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=None),
+    'obsErbB23_GAP_GRB2': lambda m: m.erbb(bd=1, ty='2') % m.erbb(bd=1, ty='3') % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=None),
+    'obsErbB24_GAP_GRB2': lambda m: m.erbb(bd=1, ty='2') % m.erbb(bd=1, ty='4') % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=None),
+    'obsErbB22_GAP_GRB2_SOS': lambda m: m.erbb(bd=1, ty='2') % m.erbb(bd=1, ty='2') % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=3) % m.SOS(bras=None, bgrb=3, bERKPP=None, st='U'),
+    'obsErbB23_GAP_GRB2_SOS': lambda m: m.erbb(bd=1, ty='2') % m.erbb(bd=1, ty='3') % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=3) % m.SOS(bras=None, bgrb=3, bERKPP=None, st='U'),
+    'obsErbB24_GAP_GRB2_SOS': lambda m: m.erbb(bd=1, ty='2') % m.erbb(bd=1, ty='4') % m.GAP(bgrb2=2) % m.GRB2(bgap=2, bsos=3) % m.SOS(bras=None, bgrb=3, bERKPP=None, st='U'),
+    'obsErbB22_GAP_SHCP': lambda m: m.erbb(bd=1, ty='2') % m.erbb(bd=1, ty='2') % m.GAP(bgrb2=None, b=2) % m.SHC(batp=None, st='P', bgrb=None, bgap=2),
+    'obsErbB23_GAP_SHCP': lambda m: m.erbb(bd=1, ty='2') % m.erbb(bd=1, ty='3') % m.GAP(bgrb2=None, b=2) % m.SHC(batp=None, st='P', bgrb=None, bgap=2),
+    'obsErbB24_GAP_SHCP': lambda m: m.erbb(bd=1, ty='2') % m.erbb(bd=1, ty='4') % m.GAP(bgrb2=None, b=2) % m.SHC(batp=None, st='P', bgrb=None, bgap=2),
+    }
+
+def add_observables(names):
+    """Add the named OBSERVABLE_DEFS entries to model; names already present are skipped."""
+    for name in names:
+        if name not in model.observables.keys():
+            model.add_component(Observable(name, OBSERVABLE_DEFS[name](model.monomers), _export=False))
+
+def add_species_observables(path):
+    """Add one observable per pattern in the pickled species list at path, named m1, m2, ..."""
+    with open(path, 'rb') as handle:
+        species = pickle.load(handle)
+    for n, pattern in enumerate(species, 1):
+        model.add_component(Observable('m%d' % n, pattern, _export=False))
+
+# Flags for the Cython-built RHS; the rate laws are plain arithmetic, so let the C
+# compiler vectorise them for the host CPU.
+NATIVE_CFLAGS = '-O3 -march=native -ffast-math -funroll-loops'
+
+# Serialises the CFLAGS change in make_sim; the environment is shared by every thread
+_CFLAGS_LOCK = threading.Lock()
+
+def make_sim(tspan, native=True):
+    """ScipyOdeSimulator for this model with the RHS emitted as C by Cython.
+
+    Cython keeps the compiled extension in its build cache, keyed on the
+    generated source, so later runs of the same network skip compilation.
+    native=True compiles with NATIVE_CFLAGS appended to any CFLAGS already
+    set; the flags are not part of the cache key, so clear Cython's cache to
+    rebuild an extension compiled without them. CFLAGS is restored on return.
+    """
+    sim = ScipyOdeSimulator(model, tspan=tspan, compiler='cython')
+    if not native:
+        return sim
+    with _CFLAGS_LOCK:
+        previous = os.environ.get('CFLAGS')
+        os.environ['CFLAGS'] = NATIVE_CFLAGS if previous is None else '%s %s' % (previous, NATIVE_CFLAGS)
+        try:
+            # The extension is compiled on the first run, so do a short one while the flags are set
+            sim.run(tspan=tspan[:2])
+        finally:
+            if previous is None:
+                del os.environ['CFLAGS']
+            else:
+                os.environ['CFLAGS'] = previous
+    return sim
+
+
+def numba_rhs(param_values=None, sparse=False, frozen=False):
+    """(rhs, args, y0) with rhs the Numba-compiled mass-action kernel; see simulation.compiled_rhs.
+
+    e.g. scipy.integrate.ode(rhs).set_integrator('lsoda').set_f_params(*args).set_initial_value(y0)
+    sparse=True opts into dy/dt = S . v with S the CSR stoichiometry matrix instead;
+    frozen=True compiles the rate constants into the kernel as literals.
+    """
+    return simulation.compiled_rhs(model, param_values, sparse=sparse, frozen=frozen)
+
+
+def simulate_batch(tspan, param_sets, **kwargs):
+    """Trajectories for each row of param_sets (ordered like model.parameters) from one
+    stacked solve; see simulation.simulate_batch."""
+    return simulation.simulate_batch(model, tspan, param_sets, **kwargs)
+
+
+def simulate_stochastic(tspan, n_runs=1, method='tau_leaping', **kwargs):
+    """Stochastic trajectories from StochKit; method is 'tau_leaping' (default) or 'ssa'.
+
+    Tau-leaping fires many reactions per step, which the direct method cannot
+    afford with the 1e7-1e9 molecule pools here (PI3K, PDK1, ATP).
+    """
+    sim = StochKitSimulator(model, tspan=tspan)
+    return sim.run(n_runs=n_runs, algorithm=method, **kwargs)
+
+
+def jacobian(param_values=None, dense=True):
+    """Analytic Jacobian jac(t, y) of the mass-action RHS; see simulation.sparse_jacobian.
+
+    dense=True returns ndarrays, as LSODA (odeint Dfun, ode.set_jac_params) expects.
+    """
+    if param_values is None:
+        param_values = np.array([p.value for p in model.parameters])
+    reactants, products, stoich, rate_fn = simulation.reaction_arrays(model)
+    jac = simulation.sparse_jacobian(np.asarray(rate_fn(*param_values), dtype=np.float64), reactants, stoich)
+    if dense:
+        return lambda t, y, *args: jac(t, y).toarray()
+    return jac
+
+
+def solve_numbalsoda(tspan, param_values=None):
+    """Integrate with numbalsoda's LSODA, calling the Numba kernel through a C callback.
+
+    The rate constants travel in lsoda's data pointer; no Python runs per step.
+    Returns the species trajectories, shape (len(tspan), n_species).
+    """
+    from numbalsoda import lsoda
+    rhs, (k, reactants, products), y0 = numba_rhs(param_values)
+    rhs_c = simulation.lsoda_rhs(reactants, products, len(y0))
+    usol, success = lsoda(rhs_c.address, y0, np.asarray(tspan, dtype=np.float64), data=k)
+    if not success:
+        raise RuntimeError("numbalsoda LSODA failed")
+    return usol
+
+
+def solve_numbalsoda_sweep(tspan, param_sets):
+    """Trajectories for each row of param_sets (ordered like model.parameters), integrated
+    in parallel; see simulation.simulate_lsoda_sweep."""
+    return simulation.simulate_lsoda_sweep(model, tspan, param_sets)
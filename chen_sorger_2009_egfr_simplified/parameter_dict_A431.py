@@ -1,10 +1,9 @@
 from pysb import *
-from collections import OrderedDict
 
 # Parameters for EGFR Model - A431 cells
 # Obtained from Chen-Sorger Jacobian files unless otherwise specified.
 # Commented values prefixed by 'c' are the variables names from Chen Sorger Jacobian files.
-parameter_dict = OrderedDict([
+parameter_dict = dict([
     ('initial_amounts', # Initial values for all starting species (in molecules/cell)
      [Parameter('erbb1_0', 1.08e6), #531
       Parameter('erbb2_0', 4.62e5), #c141
@@ -512,3 +511,10 @@ parameter_dict = OrderedDict([
       Parameter('RAS_PI3K_cat_PIPkc', 2e-1)
       ])
     ])
+
+# A dropped 'e' in an exponent (1.8704-8) turns a rate constant negative; fail at import.
+_negative = [p.name for group in parameter_dict.values()
+             for p in (group if isinstance(group, list) else [group]) if p.value < 0]
+if _negative:
+    raise ValueError('Negative rate constants in parameter_dict: %s' % ', '.join(_negative))
+del _negative
@@ -68,12 +68,17 @@ def apoptosis_sensitizer_translocation():
 def apoptosis_bim_and_puma_bind_anti_apoptotics():
     """Binding of Bim and Puma to anti-apoptotic proteins Bcl2, Bcl-XL, and Mcl1."""
     
-    bind_table([[                        Bcl2,                      BclxL(state='M'),           Mcl1(state='M')],
-                [Bim(state='M'),        (par['Bim_bind_Bcl2']),     (par['Bim_bind_BclXL']),    (par['Bim_bind_Mcl1'])],
-                [Puma(state='M'),       (par['Puma_bind_Bcl2']),    (par['Puma_bind_BclXL']),   (par['Puma_bind_Mcl1'])]],
-               'bf', 'bf')
+    # Written out rather than via bind_table, keeping the macro's rule names and order.
+    Rule('bind_BimM_Bcl2', Bim(state='M', bf=None) + Bcl2(bf=None) | Bim(state='M', bf=1) % Bcl2(bf=1), *par['Bim_bind_Bcl2'])
+    Rule('bind_BimM_BclxLM', Bim(state='M', bf=None) + BclxL(state='M', bf=None) | Bim(state='M', bf=1) % BclxL(state='M', bf=1), *par['Bim_bind_BclXL'])
+    Rule('bind_BimM_Mcl1M', Bim(state='M', bf=None) + Mcl1(state='M', bf=None) | Bim(state='M', bf=1) % Mcl1(state='M', bf=1), *par['Bim_bind_Mcl1'])
+    Rule('bind_PumaM_Bcl2', Puma(state='M', bf=None) + Bcl2(bf=None) | Puma(state='M', bf=1) % Bcl2(bf=1), *par['Puma_bind_Bcl2'])
+    Rule('bind_PumaM_BclxLM', Puma(state='M', bf=None) + BclxL(state='M', bf=None) | Puma(state='M', bf=1) % BclxL(state='M', bf=1), *par['Puma_bind_BclXL'])
+    Rule('bind_PumaM_Mcl1M', Puma(state='M', bf=None) + Mcl1(state='M', bf=None) | Puma(state='M', bf=1) % Mcl1(state='M', bf=1), *par['Puma_bind_Mcl1'])
 
 def apoptosis_bim_activate_bax():
     """Isoforms BimS and Bim-alpha3 can interact with Bax and activate it."""
     
-    catalyze_state(Bim(state='M'), 'bf', Bax(s1=None, s2=None), 'bf', 'state', 'M', 'A', (par['Bim_activate_Bax']))
\ No newline at end of file
+    kf, kr, kc = par['Bim_activate_Bax']
+    Rule('bind_BimM_BaxM_to_BimMBaxM', Bim(state='M', bf=None) + Bax(s1=None, s2=None, bf=None, state='M') | Bim(state='M', bf=1) % Bax(s1=None, s2=None, bf=1, state='M'), kf, kr)
+    Rule('catalyze_BimMBaxM_to_BimM_BaxA', Bim(state='M', bf=1) % Bax(s1=None, s2=None, bf=1, state='M') >> Bim(state='M', bf=None) + Bax(s1=None, s2=None, bf=None, state='A'), kc)
\ No newline at end of file
@@ -11,8 +11,10 @@ import sys
 
 from ..erbb_exec_Rexer import model
 
+# Fits saved before kcp/kcd were shared across dimer pairs name them kcpIJ/kcdIJ; migrate_fitted_params renames them
+# from ..chen_modules_Rexer import migrate_fitted_params
 # with open('calibration_H3255_highEGF_fittedparams_unnorm_splined_fromoriginal_priorvar6', 'rb') as handle:
-#     fittedparams = pickle.loads(handle.read())
+#     fittedparams = migrate_fitted_params(pickle.loads(handle.read()))
 
 # for i in range(len(model.parameters)):
 #     if model.parameters[i].name in fittedparams:
@@ -1,10 +1,9 @@
-from pysb import *
-from collections import OrderedDict
+from pysb import Parameter
 
 # Parameters for EGFR Model - BT474 cells
 # Obtained from Chen-Sorger Jacobian files unless otherwise specified.
 # Commented values prefixed by 'c' are the variables names from Chen Sorger Jacobian files.
-parameter_dict = OrderedDict([
+parameter_dict = dict([
     ('initial_amounts', # Initial values for all starting species (in molecules/cell)
      [Parameter('erbb1_0', 3274), #RPPA
       Parameter('erbb2_0', 3.81e5), #RPPA
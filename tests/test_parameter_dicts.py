@@ -0,0 +1,33 @@
+import importlib
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from pysb.core import SelfExporter
+except ImportError:
+    SelfExporter = None
+
+
+@unittest.skipIf(SelfExporter is None, 'pysb is not installed')
+class ParameterDictTests(unittest.TestCase):
+
+    def setUp(self):
+        # The dictionaries create their Parameters at import; keep them out of any model
+        self.do_export = SelfExporter.do_export
+        SelfExporter.do_export = False
+
+    def tearDown(self):
+        SelfExporter.do_export = self.do_export
+
+    def test_parameter_dicts_importable(self):
+        for name in ['chen_sorger_2009_egfr.parameter_dict_H1666',
+                     'chen_sorger_2009_egfr.parameter_dict_H3255']:
+            par = importlib.import_module(name).parameter_dict
+            self.assertEqual(len(par['initial_amounts']), 28, name)
+
+
+if __name__ == '__main__':
+    unittest.main()